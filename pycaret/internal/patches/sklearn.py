@@ -48,15 +48,18 @@ def _mp_sample_without_replacement(
         )
 
     rng = check_random_state(random_state)
-    rng_randint = rng.randint
     # The following line of code are heavily inspired from python core,
     # more precisely of random.sample.
+    # Integers are drawn in batches of the still missing size. Bulk
+    # ``randint`` consumes the random stream exactly like repeated scalar
+    # calls, so keeping the first occurrence of every value selects the
+    # same integers as redrawing on each collision.
     selected = set()
-    for i in range(n_samples):
-        j = rng_randint(n_population, dtype=np.uint64)
-        while j in selected:
-            j = rng_randint(n_population, dtype=np.uint64)
-        selected.add(j)
+    while len(selected) < n_samples:
+        for j in rng.randint(
+            n_population, size=n_samples - len(selected), dtype=np.uint64
+        ):
+            selected.add(j)
     return [int(x) for x in selected]
 
 
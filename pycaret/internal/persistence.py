@@ -279,6 +279,9 @@ def save_model(model, model_name: str, prep_pipe_=None, verbose: bool = True, **
     -------
     (model, model_filename):
         Tuple of the model object and the filename it was saved under.
+        If ``model`` is a Pipeline or ``prep_pipe_`` is None, the passed
+        ``model`` is returned as-is (not a copy). Otherwise, a copy of
+        ``prep_pipe_`` with ``model`` appended as the last step is returned.
 
     """
 
@@ -298,11 +301,13 @@ def save_model(model, model_name: str, prep_pipe_=None, verbose: bool = True, **
 
     logger.info("Adding model into prep_pipe")
 
+    # joblib.dump doesn't modify the object, so there is no need to copy
+    # the (potentially large) model before writing it out
     if isinstance(model, Pipeline):
-        model_ = deepcopy(model)
+        model_ = model
         logger.warning("Only Model saved as it was a pipeline.")
     elif not prep_pipe_:
-        model_ = deepcopy(model)
+        model_ = model
         logger.warning("Only Model saved. Transformations in prep_pipe are ignored.")
     else:
         model_ = deepcopy(prep_pipe_)
@@ -24,15 +24,9 @@ from sklearn.cross_decomposition import PLSRegression
 from sklearn.manifold import TSNE
 from sklearn.decomposition import IncrementalPCA
 from sklearn.preprocessing import KBinsDiscretizer
-from pyod.models.knn import KNN
-from pyod.models.iforest import IForest
-from pyod.models.pca import PCA as PCA_od
 from sklearn import cluster
-from scipy import stats
 from sklearn.ensemble import RandomForestClassifier as rfc
 from sklearn.ensemble import RandomForestRegressor as rfr
-from lightgbm import LGBMClassifier as lgbmc
-from lightgbm import LGBMRegressor as lgbmr
 import sys
 import gc
 from sklearn.pipeline import Pipeline
@@ -1182,12 +1176,14 @@ class Group_Similar_Features(BaseEstimator, TransformerMixin):
         data = dataset
         # # only going to process if there is an actual missing value in training data set
         if len(self.list_of_similar_features) > 0:
+            import scipy.stats
+
             for f, g in zip(self.list_of_similar_features, self.group_name):
                 data[g + "_Min"] = data[f].apply(np.min, 1)
                 data[g + "_Max"] = data[f].apply(np.max, 1)
                 data[g + "_Mean"] = data[f].apply(np.mean, 1)
                 data[g + "_Median"] = data[f].apply(np.median, 1)
-                data[g + "_Mode"] = stats.mode(data[f], 1)[0]
+                data[g + "_Mode"] = scipy.stats.mode(data[f], 1)[0]
                 data[g + "_Std"] = data[f].apply(np.std, 1)
 
             return data
@@ -1672,12 +1668,16 @@ class Outlier(BaseEstimator, TransformerMixin):
         data_without_target = data.drop(self.target, axis=1)
 
         if "knn" in self.methods:
+            from pyod.models.knn import KNN
+
             self.knn = KNN(contamination=self.contamination)
             self.knn.fit(data_without_target)
             knn_predict = self.knn.predict(data_without_target)
             data_without_target["knn"] = knn_predict
 
         if "iso" in self.methods:
+            from pyod.models.iforest import IForest
+
             self.iso = IForest(
                 contamination=self.contamination,
                 random_state=self.random_state,
@@ -1688,6 +1688,8 @@ class Outlier(BaseEstimator, TransformerMixin):
             data_without_target["iso"] = iso_predict
 
         if "pca" in self.methods:
+            from pyod.models.pca import PCA as PCA_od
+
             self.pca = PCA_od(
                 contamination=self.contamination, random_state=self.random_state
             )
@@ -2298,6 +2300,9 @@ class Advanced_Feature_Selection_Classic(BaseEstimator, TransformerMixin):
         dummy_all_columns_RF = dummy_all[top].columns
 
         # LightGBM
+        from lightgbm import LGBMClassifier as lgbmc
+        from lightgbm import LGBMRegressor as lgbmr
+
         max_fe = min(70, int(np.sqrt(len(dummy_all.columns))))
         max_sa = min(
             float(1000 / len(dummy_all)),
@@ -29,10 +29,7 @@ from pycaret.internal.utils import (
     set_n_jobs,
 )
 import pycaret.internal.patches.sklearn
-import pycaret.internal.patches.yellowbrick
 from pycaret.internal.logging import get_logger
-from pycaret.internal.plots.yellowbrick import show_yellowbrick_plot
-from pycaret.internal.plots.helper import MatplotlibDefaultDPI
 from pycaret.internal.Display import Display, is_in_colab
 from pycaret.internal.distributions import *
 from pycaret.internal.validation import *
@@ -66,9 +63,6 @@ import warnings
 from IPython.utils import io
 import traceback
 from unittest.mock import patch
-import plotly.express as px
-import plotly.graph_objects as go
-import scikitplot as skplt
 from packaging import version
 
 warnings.filterwarnings("ignore")
@@ -1391,13 +1385,6 @@ def setup(
         target_type = "Binary"
 
     if _ml_usecase == MLUsecase.CLASSIFICATION:
-        _all_models = {
-            k: v
-            for k, v in pycaret.containers.models.classification.get_all_model_containers(
-                globals(), raise_errors=True
-            ).items()
-            if not v.is_special
-        }
         _all_models_internal = (
             pycaret.containers.models.classification.get_all_model_containers(
                 globals(), raise_errors=True
@@ -1409,13 +1396,6 @@ def setup(
             )
         )
     elif _ml_usecase == MLUsecase.REGRESSION:
-        _all_models = {
-            k: v
-            for k, v in pycaret.containers.models.regression.get_all_model_containers(
-                globals(), raise_errors=True
-            ).items()
-            if not v.is_special
-        }
         _all_models_internal = (
             pycaret.containers.models.regression.get_all_model_containers(
                 globals(), raise_errors=True
@@ -1425,13 +1405,6 @@ def setup(
             globals(), raise_errors=True
         )
     elif _ml_usecase == MLUsecase.CLUSTERING:
-        _all_models = {
-            k: v
-            for k, v in pycaret.containers.models.clustering.get_all_model_containers(
-                globals(), raise_errors=True
-            ).items()
-            if not v.is_special
-        }
         _all_models_internal = (
             pycaret.containers.models.clustering.get_all_model_containers(
                 globals(), raise_errors=True
@@ -1441,13 +1414,6 @@ def setup(
             globals(), raise_errors=True
         )
     elif _ml_usecase == MLUsecase.ANOMALY:
-        _all_models = {
-            k: v
-            for k, v in pycaret.containers.models.anomaly.get_all_model_containers(
-                globals(), raise_errors=True
-            ).items()
-            if not v.is_special
-        }
         _all_models_internal = (
             pycaret.containers.models.anomaly.get_all_model_containers(
                 globals(), raise_errors=True
@@ -1457,6 +1423,8 @@ def setup(
             globals(), raise_errors=True
         )
 
+    _all_models = {k: v for k, v in _all_models_internal.items() if not v.is_special}
+
     """
     Final display Starts
     """
@@ -2329,7 +2297,10 @@ def compare_models(
                     groups=groups,
                     probability_threshold=probability_threshold,
                 )
-                if errors == "raise":
+                if not cross_validation:
+                    # already fitted on the whole training set above
+                    sorted_models.append(model)
+                elif errors == "raise":
                     model, model_fit_time = create_model_supervised(**create_model_args)
                     sorted_models.append(model)
                 else:
@@ -3013,11 +2984,6 @@ def create_model_supervised(
 
     display.move_progress()
 
-    logger.info("Defining folds")
-
-    # cross validation setup starts here
-    cv = _get_cv_splitter(fold)
-
     logger.info("Declaring metric variables")
 
     """
@@ -3126,12 +3092,16 @@ def create_model_supervised(
             return (model, model_fit_time)
         return model
 
+    logger.info("Defining folds")
+
+    # cross validation setup starts here
+    cv = _get_cv_splitter(fold)
+    n_folds = _get_cv_n_folds(cv, data_X, y=data_y, groups=groups)
+
     """
     MONITOR UPDATE STARTS
     """
-    display.update_monitor(
-        1, f"Fitting {_get_cv_n_folds(fold, data_X, y=data_y, groups=groups)} Folds"
-    )
+    display.update_monitor(1, f"Fitting {n_folds} Folds")
     display.display_monitor()
     """
     MONITOR UPDATE ENDS
@@ -3173,26 +3143,28 @@ def create_model_supervised(
         model_fit_end = time.time()
         model_fit_time = np.array(model_fit_end - model_fit_start).round(2)
 
-        score_dict = {
-            v.display_name: scores[f"test_{k}"] * (1 if v.greater_is_better else -1)
-            for k, v in metrics.items()
-        }
+        # (n_folds, n_metrics) array, signs flipped for greater_is_worse metrics
+        score_array = np.column_stack(
+            [scores[f"test_{k}"] for k in metrics.keys()]
+        ) * np.array([1 if v.greater_is_better else -1 for v in metrics.values()])
+        score_columns = [v.display_name for v in metrics.values()]
 
         logger.info("Calculating mean and std")
 
-        avgs_dict = {k: [np.mean(v), np.std(v)] for k, v in score_dict.items()}
+        # fold rows followed by the Mean and SD rows, wrapped into a frame once
+        score_grid = np.vstack(
+            (score_array, score_array.mean(axis=0), score_array.std(axis=0))
+        )
 
         display.move_progress()
 
         logger.info("Creating metrics dataframe")
 
-        model_results = pd.DataFrame(score_dict)
-        model_avgs = pd.DataFrame(
-            avgs_dict,
-            index=["Mean", "SD"],
+        model_results = pd.DataFrame(
+            score_grid,
+            columns=score_columns,
+            index=list(range(len(score_array))) + ["Mean", "SD"],
         )
-
-        model_results = model_results.append(model_avgs)
         model_results = model_results.round(round)
 
         # yellow the mean
@@ -3211,7 +3183,7 @@ def create_model_supervised(
 
             model_fit_time = np.array(model_fit_end - model_fit_start).round(2)
         else:
-            model_fit_time /= _get_cv_n_folds(cv, data_X, y=data_y, groups=groups)
+            model_fit_time /= n_folds
 
         # end runtime
         runtime_end = time.time()
@@ -3220,8 +3192,7 @@ def create_model_supervised(
     # mlflow logging
     if logging_param and system and refit:
 
-        avgs_dict_log = avgs_dict.copy()
-        avgs_dict_log = {k: v[0] for k, v in avgs_dict_log.items()}
+        avgs_dict_log = dict(zip(score_columns, score_grid[-2]))
 
         try:
             _mlflow_log_model(
@@ -3586,6 +3557,8 @@ def tune_model_unsupervised(
 
     if html_param and verbose:
         logger.info("Rendering Visual")
+        import plotly.graph_objects as go
+
         plot_df = results.data.drop(
             [x for x in results.columns if x != optimize.display_name], axis=1
         )
@@ -5960,6 +5933,11 @@ def plot_model(
     logger.info("Preloading libraries")
     # pre-load libraries
     import matplotlib.pyplot as plt
+    import plotly.express as px
+    import scikitplot as skplt
+    import pycaret.internal.patches.yellowbrick as yellowbrick_patches
+    from pycaret.internal.plots.yellowbrick import show_yellowbrick_plot
+    from pycaret.internal.plots.helper import MatplotlibDefaultDPI
 
     np.random.seed(seed)
 
@@ -6013,13 +5991,13 @@ def plot_model(
     plot_filename = f"{plot_name}.png"
     with patch(
         "yellowbrick.utils.types.is_estimator",
-        pycaret.internal.patches.yellowbrick.is_estimator,
+        yellowbrick_patches.is_estimator,
     ), patch(
         "yellowbrick.utils.helpers.is_estimator",
-        pycaret.internal.patches.yellowbrick.is_estimator,
+        yellowbrick_patches.is_estimator,
     ), patch(
         "yellowbrick.utils.helpers.get_model_name",
-        pycaret.internal.patches.yellowbrick.get_model_name,
+        yellowbrick_patches.get_model_name,
     ), estimator_pipeline(
         _internal_pipeline, model
     ) as pipeline_with_model:
@@ -8365,6 +8343,9 @@ def optimize_threshold(
     optimize_results = pd.DataFrame(
         {"Probability Threshold": grid, "Cost Function": cost}
     )
+
+    import plotly.express as px
+
     fig = px.line(
         optimize_results,
         x="Probability Threshold",
@@ -8774,13 +8755,15 @@ def predict_model(
         df_score = df_score.round(round)
         display.display(df_score.style.set_precision(round), clear=False)
 
-    label = pd.DataFrame(pred)
-    label.columns = ["Label"]
+    # some estimators (e.g. PLSRegression) return (n_samples, 1) predictions
+    if pred.ndim == 2 and pred.shape[1] == 1:
+        pred = pred.ravel()
+    label = pd.Series(pred, name="Label")
     if not encoded_labels:
-        replace_lables_in_column(label["Label"])
+        replace_lables_in_column(label)
     if ml_usecase == MLUsecase.CLASSIFICATION:
         try:
-            label["Label"] = label["Label"].astype(int)
+            label = label.astype(int)
         except:
             pass
 
@@ -8790,12 +8773,12 @@ def predict_model(
         X_test_ = pd.concat([X_test_, y_test_, label], axis=1)
     else:
         X_test_ = data.copy()
-        X_test_["Label"] = label["Label"].values
+        X_test_["Label"] = label.values
 
     if score is not None:
         pred = pred.astype(int)
         if not raw_score:
-            score = [s[pred[i]] for i, s in enumerate(score)]
+            score = score[np.arange(len(pred)), pred]
         try:
             score = pd.DataFrame(score)
             if raw_score:
@@ -9603,8 +9586,7 @@ def models(
         if (internal or not v.is_special)
     ]
 
-    df = pd.DataFrame(rows)
-    df.set_index("ID", inplace=True, drop=True)
+    df = pd.DataFrame.from_records(rows, index="ID")
 
     return filter_model_df_by_type(df)
 
@@ -9664,8 +9646,7 @@ def get_metrics(
     metric_containers = _all_metrics
     rows = [v.get_dict() for k, v in metric_containers.items()]
 
-    df = pd.DataFrame(rows)
-    df.set_index("ID", inplace=True, drop=True)
+    df = pd.DataFrame.from_records(rows, index="ID")
 
     if not include_custom:
         df = df[df["Custom"] == False]
@@ -9997,13 +9978,6 @@ def load_config(file_name: str):
     r = pycaret.internal.utils.load_config(file_name, globals())
 
     if _ml_usecase == MLUsecase.CLASSIFICATION:
-        _all_models = {
-            k: v
-            for k, v in pycaret.containers.models.classification.get_all_model_containers(
-                globals(), raise_errors=True
-            ).items()
-            if not v.is_special
-        }
         _all_models_internal = (
             pycaret.containers.models.classification.get_all_model_containers(
                 globals(), raise_errors=True
@@ -10015,13 +9989,6 @@ def load_config(file_name: str):
             )
         )
     elif _ml_usecase == MLUsecase.REGRESSION:
-        _all_models = {
-            k: v
-            for k, v in pycaret.containers.models.regression.get_all_model_containers(
-                globals(), raise_errors=True
-            ).items()
-            if not v.is_special
-        }
         _all_models_internal = (
             pycaret.containers.models.regression.get_all_model_containers(
                 globals(), raise_errors=True
@@ -10031,13 +9998,6 @@ def load_config(file_name: str):
             globals(), raise_errors=True
         )
     elif _ml_usecase == MLUsecase.CLUSTERING:
-        _all_models = {
-            k: v
-            for k, v in pycaret.containers.models.clustering.get_all_model_containers(
-                globals(), raise_errors=True
-            ).items()
-            if not v.is_special
-        }
         _all_models_internal = (
             pycaret.containers.models.clustering.get_all_model_containers(
                 globals(), raise_errors=True
@@ -10048,13 +10008,6 @@ def load_config(file_name: str):
         )
         X_train = X
     elif _ml_usecase == MLUsecase.ANOMALY:
-        _all_models = {
-            k: v
-            for k, v in pycaret.containers.models.anomaly.get_all_model_containers(
-                globals(), raise_errors=True
-            ).items()
-            if not v.is_special
-        }
         _all_models_internal = (
             pycaret.containers.models.anomaly.get_all_model_containers(
                 globals(), raise_errors=True
@@ -10065,6 +10018,8 @@ def load_config(file_name: str):
         )
         X_train = X
 
+    _all_models = {k: v for k, v in _all_models_internal.items() if not v.is_special}
+
     create_model_container = []
     master_model_container = []
     display_container = []
@@ -4,7 +4,9 @@
 
 # Provides a VotingClassifier which weights can be tuned.
 
+import numpy as np
 from sklearn.base import clone
+from sklearn.utils.validation import check_is_fitted
 from sklearn.ensemble import VotingClassifier, VotingRegressor
 from sklearn.neural_network import MLPClassifier, MLPRegressor
 import inspect
@@ -1081,6 +1083,37 @@ class TunableVotingClassifier(VotingClassifier, TunableMixin):
                     r[f"weight_{i}"] = w
         return r
 
+    def predict(self, X):
+        """
+        Predict class labels for X.
+
+        Hard voting tallies the (weighted) votes for all samples at once
+        instead of calling ``np.bincount`` row by row.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            The input samples.
+
+        Returns
+        -------
+        maj : array-like of shape (n_samples,)
+            Predicted class labels.
+        """
+        if self.voting == "soft":
+            return super().predict(X)
+        check_is_fitted(self)
+        predictions = self._predict(X).astype(np.intp, copy=False)
+        weights = self._weights_not_none
+        if weights is None:
+            weights = np.ones(predictions.shape[1])
+        votes = np.zeros((predictions.shape[0], len(self.le_.classes_)))
+        rows = np.arange(predictions.shape[0])
+        for i, weight in enumerate(weights):
+            votes[rows, predictions[:, i]] += weight
+        maj = np.argmax(votes, axis=1)
+        return self.le_.inverse_transform(maj)
+
 
 class TunableVotingRegressor(VotingRegressor, TunableMixin):
     """
@@ -2812,9 +2812,7 @@ def plot_model(model=None, plot="frequency", topic_num=None, save=False, system=
         )
         ass_df = assign_model(model, verbose=False)
         logger.info("SubProcess assign_model() end ==================================")
-        ass_df_pivot = ass_df.pivot_table(
-            index="Dominant_Topic", values="Topic_0", aggfunc="count"
-        )
+        ass_df_pivot = ass_df.groupby("Dominant_Topic")[["Topic_0"]].count()
         df2 = ass_df_pivot.join(kw_df)
         df2 = df2.reset_index()
         df2.columns = ["Topic", "Documents", "Keyword"]
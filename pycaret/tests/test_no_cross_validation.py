@@ -0,0 +1,64 @@
+import os, sys
+
+sys.path.insert(0, os.path.abspath(".."))
+
+import numpy as np
+import pandas as pd
+import pytest
+import pycaret.classification
+import pycaret.datasets
+from sklearn.utils.validation import check_is_fitted
+
+
+def _holdout_scores(model):
+    pycaret.classification.predict_model(model)
+    return pycaret.classification.pull().drop("Model", axis=1).iloc[0]
+
+
+def test():
+    # loading dataset
+    data = pycaret.datasets.get_data("juice")
+    assert isinstance(data, pd.core.frame.DataFrame)
+
+    # init setup
+    clf1 = pycaret.classification.setup(
+        data,
+        target="Purchase",
+        silent=True,
+        html=False,
+        session_id=123,
+        n_jobs=1,
+    )
+
+    # create model without cross validation
+    lr = pycaret.classification.create_model("lr", cross_validation=False)
+    create_grid = pycaret.classification.pull()
+    check_is_fitted(lr)
+    assert np.allclose(
+        create_grid.iloc[0].astype(float),
+        _holdout_scores(lr)[create_grid.columns].astype(float),
+    )
+
+    # compare models without cross validation
+    top3 = pycaret.classification.compare_models(
+        include=["lr", "dt", "knn"], cross_validation=False, n_select=3
+    )
+    compare_grid = pycaret.classification.pull()
+    assert isinstance(top3, list)
+    assert len(top3) == 3
+    assert len({id(model) for model in top3}) == 3
+
+    metric_columns = compare_grid.columns.drop(["Model", "TT (Sec)"])
+    for i, model in enumerate(top3):
+        check_is_fitted(model)
+        # returned models are the ones scored on the holdout set
+        assert np.allclose(
+            compare_grid.iloc[i][metric_columns].astype(float),
+            _holdout_scores(model)[metric_columns].astype(float),
+        )
+
+    assert 1 == 1
+
+
+if __name__ == "__main__":
+    test()
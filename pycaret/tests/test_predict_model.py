@@ -0,0 +1,44 @@
+import os, sys
+
+sys.path.insert(0, os.path.abspath(".."))
+
+import pandas as pd
+import pytest
+import pycaret.regression
+import pycaret.datasets
+from sklearn.cross_decomposition import PLSRegression
+
+
+def test_2d_predictions():
+    # loading dataset
+    data = pycaret.datasets.get_data("boston")
+    assert isinstance(data, pd.core.frame.DataFrame)
+
+    # init setup
+    reg1 = pycaret.regression.setup(
+        data,
+        target="medv",
+        silent=True,
+        html=False,
+        session_id=123,
+        n_jobs=1,
+    )
+
+    # PLSRegression.predict returns predictions of shape (n_samples, 1)
+    pls = pycaret.regression.create_model(PLSRegression(), cross_validation=False)
+
+    # hold out predictions
+    predict_holdout = pycaret.regression.predict_model(pls)
+    assert isinstance(predict_holdout, pd.core.frame.DataFrame)
+    assert predict_holdout["Label"].ndim == 1
+    assert predict_holdout["Label"].notnull().all()
+
+    # predictions on new dataset
+    predict_data = pycaret.regression.predict_model(pls, data=data)
+    assert isinstance(predict_data, pd.core.frame.DataFrame)
+    assert len(predict_data) == len(data)
+    assert predict_data["Label"].notnull().all()
+
+
+if __name__ == "__main__":
+    test_2d_predictions()
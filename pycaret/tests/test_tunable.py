@@ -0,0 +1,52 @@
+import os, sys
+
+sys.path.insert(0, os.path.abspath(".."))
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import VotingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.naive_bayes import GaussianNB
+from sklearn.tree import DecisionTreeClassifier
+from pycaret.internal.tunable import TunableVotingClassifier
+
+
+@pytest.mark.parametrize(
+    "weights", [None, [1, 1, 1], [0.2, 0.5, 0.3], [3, 1, 2], [1, 2, 2]]
+)
+def test_hard_voting_matches_sklearn(weights):
+    X, y = make_classification(
+        n_samples=300,
+        n_features=8,
+        n_informative=5,
+        n_classes=3,
+        random_state=123,
+    )
+    # string labels so the label encoder round-trip is exercised
+    y = np.array(["apple", "banana", "cherry"])[y]
+
+    estimators = [
+        ("lr", LogisticRegression(max_iter=1000)),
+        ("dt", DecisionTreeClassifier(max_depth=3, random_state=123)),
+        ("nb", GaussianNB()),
+    ]
+
+    expected = (
+        VotingClassifier(estimators=estimators, voting="hard", weights=weights)
+        .fit(X, y)
+        .predict(X)
+    )
+    tunable = TunableVotingClassifier(
+        estimators=estimators,
+        voting="hard",
+        weights=list(weights) if weights else None,
+    ).fit(X, y)
+    result = tunable.predict(X)
+
+    assert result.dtype == expected.dtype
+    assert np.array_equal(result, expected)
+
+
+if __name__ == "__main__":
+    test_hard_voting_matches_sklearn(None)